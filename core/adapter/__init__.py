@@ -4,14 +4,41 @@ AI Provider Adapter Module
 Provides a unified interface for various AI service providers through a common adapter pattern.
 """
 
-from enum import Enum
-from typing import Dict, Type, Optional
+import asyncio
+import random
+import time
+from enum import Enum, unique
+from functools import lru_cache
+from typing import Dict, List, Type, Optional
+
+import httpx
+import openai
+
+from core.config import settings
+from core.logger import setup_logger
 from .base_client import BaseAIClient, ChatMessage, ChatRequest
 from .deepseek_client import DeepSeekClient
 from .openai_client import OpenAIClient
 
+logger = setup_logger(__name__)
 
+# Transient provider failures worth retrying
+RETRYABLE_ERRORS = (
+    httpx.TimeoutException,
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+MAX_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 20
 
+def _backoff(attempt: int) -> float:
+    """Random exponential backoff (with jitter) before the next attempt."""
+    return random.uniform(1, min(MAX_BACKOFF_SECONDS, 2 ** attempt))
+
+
+@unique
 class Provider(Enum):
     """Enumeration of supported AI service providers.
     
@@ -32,24 +59,46 @@ class Provider(Enum):
 class Models:
     """Supported models organized by provider"""
     
+    @unique
     class OPENAI(Enum):
         GPT4 = "gpt-4"
         GPT4O = "gpt-4o"
         GPT35 = "gpt-3.5-turbo"
 
+    @unique
     class DEEPSEEK(Enum):
         CHAT = "deepseek-chat"
         CODER = "deepseek-coder"
 
+    # Default model per provider
+    _DEFAULTS = {
+        Provider.OPENAI: OPENAI.GPT4.value,
+        Provider.DEEPSEEK: DEEPSEEK.CHAT.value
+    }
+
+    # Default number of in-flight requests allowed per provider
+    _CONCURRENCY = {
+        Provider.OPENAI: 50,
+        Provider.DEEPSEEK: 20
+    }
+
+    @classmethod
+    def get_concurrency(cls, provider: Provider) -> int:
+        """Get default concurrent request limit for a provider"""
+        return cls._CONCURRENCY[provider]
+
     @classmethod
     def get_default(cls, provider: Provider) -> str:
         """Get default model for a provider"""
-        return {
-            Provider.OPENAI: cls.OPENAI.GPT4.value,
-            Provider.DEEPSEEK: cls.DEEPSEEK.CHAT.value
-        }[provider]
+        return cls._DEFAULTS[provider]
 
-PROVIDERS = [member.value for member in Provider]  # Supported provider identifiers
+PROVIDERS = frozenset(member.value for member in Provider)  # Supported provider identifiers
+
+# Supported model identifiers per provider, built once at import time
+_PROVIDER_MODELS: Dict[Provider, frozenset] = {
+    Provider.OPENAI: frozenset(m.value for m in Models.OPENAI),
+    Provider.DEEPSEEK: frozenset(m.value for m in Models.DEEPSEEK)
+}
 
 
 class MultiProviderClient:
@@ -65,7 +114,7 @@ class MultiProviderClient:
         ValueError: For unsupported providers, invalid credentials, or unsupported models
 
     Example:
-        >>> client = MultiProviderClient(Provider.OPENAI, "sk-...")
+        >>> client = MultiProviderClient.get_instance(Provider.OPENAI, "sk-...")
         >>> request = ChatRequest(...)
         >>> response = client.chat_completion(request)
     """
@@ -82,21 +131,32 @@ class MultiProviderClient:
         self.provider = provider
         self.api_key = api_key
         self.model = model or Models.get_default(provider)
+        # Bounds concurrent in-flight async calls to stay within provider rate limits
+        self._sem = asyncio.Semaphore(settings.llm_concurrency or Models.get_concurrency(provider))
         
         self._validate_model()
         self._initialize_client()
 
+    @classmethod
+    @lru_cache(maxsize=32)
+    def get_instance(cls, provider: Provider, api_key: str, model: str = None) -> "MultiProviderClient":
+        """Return a shared client for the given provider, key and model.
+        
+        Instances are memoized so the underlying SDK client and its HTTP
+        connection pool are reused across requests instead of rebuilt.
+        
+        Example:
+            >>> client = MultiProviderClient.get_instance(Provider.OPENAI, "sk-...")
+        """
+        return cls(provider, api_key, model)
+
     def _validate_model(self):
         """Validate model compatibility with provider"""
-        provider_models = {
-            Provider.OPENAI: [m.value for m in Models.OPENAI],
-            Provider.DEEPSEEK: [m.value for m in Models.DEEPSEEK]
-        }
-        
-        if self.model not in provider_models[self.provider]:
+        supported = _PROVIDER_MODELS[self.provider]
+        if self.model not in supported:
             raise ValueError(
                 f"Model '{self.model}' not supported by {self.provider.value}. "
-                f"Supported: {provider_models[self.provider]}"
+                f"Supported: {sorted(supported)}"
             )
 
     def _initialize_client(self):
@@ -112,6 +172,17 @@ class MultiProviderClient:
                 f"Failed to initialize {self.provider.value} client: {str(e)}"
             ) from e
 
+    def _retry_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """Log a retryable failure and return the backoff before the next attempt, or None once attempts run out."""
+        if attempt == MAX_ATTEMPTS:
+            return None
+        delay = _backoff(attempt)
+        logger.warning(
+            "%s call failed (attempt %d/%d): %s. Retrying in %.1fs",
+            self.provider.value, attempt, MAX_ATTEMPTS, error, delay
+        )
+        return delay
+
     def chat_completion(self, request: ChatRequest) -> Dict:
         """Execute chat completion request through configured provider.
         
@@ -124,7 +195,47 @@ class MultiProviderClient:
         Raises:
             ProviderAPIError: For errors in the underlying provider API
         """
-        return self.client.chat_completion(request)
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                return self.client.chat_completion(request)
+            except RETRYABLE_ERRORS as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+    async def achat_completion(self, request: ChatRequest) -> Dict:
+        """Execute chat completion request without blocking the event loop.
+        
+        Args:
+            request: ChatRequest object containing model and messages
+            
+        Returns:
+            Dictionary with provider-specific response format
+            
+        Raises:
+            ProviderAPIError: For errors in the underlying provider API
+        """
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                async with self._sem:
+                    return await self.client.achat_completion(request)
+            except RETRYABLE_ERRORS as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+    async def achat_completion_batch(self, requests: List[ChatRequest]) -> List[Dict]:
+        """Execute multiple chat completion requests through configured provider.
+        
+        Args:
+            requests: ChatRequest objects to execute
+            
+        Returns:
+            List of provider responses in the same order as requests
+        """
+        return list(await asyncio.gather(*(self.achat_completion(r) for r in requests)))
 
 
 __all__ = [
@@ -4,9 +4,12 @@ Base Definitions for AI Provider Adapters
 Defines core interfaces and data structures for AI service provider implementations.
 """
 
+import anyio.to_thread
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, TypeVar
+import httpx
 
 @dataclass
 class ChatMessage:
@@ -40,6 +43,14 @@ class ChatRequest:
     model: str
     messages: List[ChatMessage] = field(default_factory=list)
 
+T = TypeVar("T")
+
+_message_fields = attrgetter("role", "content")
+
+def to_message_dicts(messages: List[ChatMessage]) -> List[Dict[str, str]]:
+    """Convert chat messages to the role/content dicts provider APIs expect."""
+    return [{"role": role, "content": content} for role, content in map(_message_fields, messages)]
+
 class BaseAIClient(ABC):
     """Abstract base class defining the interface for AI provider clients.
     
@@ -50,8 +61,40 @@ class BaseAIClient(ABC):
     - Provider-specific API communication
     - Error handling
     - Response formatting
+
+    Async provider calls should go through the shared pool returned by
+    ``get_http`` so concurrent requests reuse warm HTTP/2 connections instead
+    of paying a TCP + TLS handshake per call.
     """
 
+    _http: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def get_http() -> httpx.AsyncClient:
+        """Return the shared async HTTP connection pool, opening it if it is not open."""
+        if BaseAIClient._http is None or BaseAIClient._http.is_closed:
+            BaseAIClient._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=50, keepalive_expiry=300),
+                timeout=60.0
+            )
+        return BaseAIClient._http
+
+    @staticmethod
+    async def aclose() -> None:
+        """Close the shared async HTTP connection pool; the next call opens a new one."""
+        http, BaseAIClient._http = BaseAIClient._http, None
+        if http is not None:
+            await http.aclose()
+
+    def _bound_async_client(self, build: Callable[[httpx.AsyncClient], T]) -> T:
+        """Return the async SDK client built by `build`, rebuilding it whenever the shared pool is reopened."""
+        http = self.get_http()
+        if getattr(self, "_aclient_http", None) is not http:
+            self._aclient = build(http)
+            self._aclient_http = http
+        return self._aclient
+
     @abstractmethod
     def chat_completion(self, request: ChatRequest) -> Dict:
         """Execute a chat completion request through the provider's API.
@@ -74,3 +117,21 @@ class BaseAIClient(ABC):
             >>> print(response['content'])
         """
         raise NotImplementedError("Subclasses must implement chat_completion")
+
+    async def achat_completion(self, request: ChatRequest) -> Dict:
+        """Asynchronously execute a chat completion request.
+        
+        Non-blocking counterpart of chat_completion for use inside the event loop.
+        Providers with an async SDK should override this; the default runs the
+        synchronous implementation in a worker thread.
+        
+        Args:
+            request: ChatRequest containing model and message history
+            
+        Returns:
+            Dictionary with the same shape as chat_completion
+            
+        Example:
+            >>> response = await client.achat_completion(request)
+        """
+        return await anyio.to_thread.run_sync(self.chat_completion, request)
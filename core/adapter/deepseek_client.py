@@ -1,10 +1,31 @@
-from .base_client import BaseAIClient, ChatRequest
+from .base_client import BaseAIClient, ChatRequest, to_message_dicts
+from openai import AsyncOpenAI
 from typing import Dict
+
+DEEPSEEK_BASE_URL = "https://api.deepseek.com"
+
 class DeepSeekClient(BaseAIClient):
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, model: str = None):
         self.api_key = api_key
-        # Initialize the DeepSeek client here
+        self.model = model
 
     def chat_completion(self, request: ChatRequest) -> Dict:
         # Implementation for DeepSeek
         return {"provider": "DeepSeek", "result": "This is a DeepSeek response."}
+
+    def _async_client(self) -> AsyncOpenAI:
+        # DeepSeek exposes an OpenAI-compatible API
+        return self._bound_async_client(
+            lambda http: AsyncOpenAI(api_key=self.api_key, base_url=DEEPSEEK_BASE_URL, max_retries=0, http_client=http)
+        )
+
+    async def achat_completion(self, request: ChatRequest) -> Dict:
+        response = await self._async_client().chat.completions.create(
+            messages=to_message_dicts(request.messages),
+            model=request.model
+        )
+        return {
+            "provider": "DeepSeek",
+            "request_id": response.id,
+            "content": response.choices[0].message.content
+        }
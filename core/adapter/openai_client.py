@@ -1,14 +1,41 @@
-from .base_client import BaseAIClient, ChatRequest
-from openai import OpenAI
+from .base_client import BaseAIClient, ChatRequest, to_message_dicts
+from openai import OpenAI, AsyncOpenAI
 from typing import Dict
+import httpx
+
+# Keep-alive pool shared by all requests issued through one client instance
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20)
 
 class OpenAIClient(BaseAIClient):
-    def __init__(self, api_key: str):
-        self.client = OpenAI(api_key=api_key)
+    def __init__(self, api_key: str, model: str = None):
+        self.model = model
+        # Retries are handled by MultiProviderClient
+        self.client = OpenAI(
+            api_key=api_key,
+            max_retries=0,
+            http_client=httpx.Client(limits=HTTP_LIMITS)
+        )
+        self.api_key = api_key
         
     def chat_completion(self, request: ChatRequest) -> Dict:
         response = self.client.chat.completions.create(
-            messages=[{"role": m.role, "content": m.content} for m in request.messages],
+            messages=to_message_dicts(request.messages),
+            model=request.model
+        )
+        return {
+            "provider": "OpenAI",
+            "request_id": response._request_id,
+            "content": response.choices[0].message.content
+        }
+
+    def _async_client(self) -> AsyncOpenAI:
+        return self._bound_async_client(
+            lambda http: AsyncOpenAI(api_key=self.api_key, max_retries=0, http_client=http)
+        )
+
+    async def achat_completion(self, request: ChatRequest) -> Dict:
+        response = await self._async_client().chat.completions.create(
+            messages=to_message_dicts(request.messages),
             model=request.model
         )
         return {
@@ -1,65 +1,103 @@
-from dotenv import load_dotenv
-load_dotenv()
-
-from pydantic_settings import BaseSettings
-from pydantic import Field
-import os
-from typing import List
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+from pydantic import AliasChoices, Field, field_validator
+from functools import lru_cache
+from typing import Annotated, List
 
 
 class Settings(BaseSettings):
     # API Keys
     openai_api_key: str = Field(
-        default=os.getenv("OPENAI_API_KEY", ""),
+        default="",
         description="OpenAI API key for accessing their services"
     )
     deepseek_api_key: str = Field(
-        default=os.getenv("DEEPSEEK_API_KEY", ""),
+        default="",
         description="DeepSeek API key for their AI services"
     )
     groq_api_key: str = Field(
-        default=os.getenv("GROQ_API_KEY", ""),
+        default="",
         description="Groq API key for their accelerated AI models"
     )
 
+    # AI Provider Settings
+    llm_concurrency: int = Field(
+        default=0,
+        description="Max concurrent AI provider calls per client (0 uses the provider default)"
+    )
+
     # Database Settings
     supabase_url: str = Field(
-        default=os.getenv("SUPABASE_URL", ""),
+        default="",
         description="Supabase URL"
     )
     supabase_key: str = Field(
-        default=os.getenv("SUPABASE_KEY", ""),
+        default="",
         description="Supabase Key"
     )
     supabase_service_role_key: str = Field(
-        default=os.getenv("SUPABASE_SERVICE_ROLE_KEY", ""),
+        default="",
         description="Supabase Service Role Key"
     )
     supabase_jwt_secret: str = Field(
-        default=os.getenv("SUPABSE_JWT_SECRET", ""),
+        default="",
+        # SUPABSE_JWT_SECRET is the historical (misspelled) variable name
+        validation_alias=AliasChoices("SUPABASE_JWT_SECRET", "SUPABSE_JWT_SECRET"),
         description="Supabase JWT Secret"
     )
+    supabase_verify_jwt_locally: bool = Field(
+        default=True,
+        description="Verify Bearer tokens with the JWT secret instead of calling Supabase Auth"
+    )
+    bearer_token_cache_ttl: int = Field(
+        default=30,
+        description="Seconds a verified Bearer token or organization membership is cached (0 disables the cache)"
+    )
 
     # HubSpot Settings
     hubspot_app_id: str = Field(
-        default=os.getenv("HUBSPOT_APP_ID", ""),
+        default="",
         description="This is your app's unique ID. You'll need it to make certain API calls."
     )
     hubspot_client_id: str = Field(
-        default=os.getenv("HUBSPOT_CLIENT_ID", ""),
+        default="",
         description="This ID is unique to your app and is used for initiating OAuth."
     )
     hubspot_client_secret: str = Field(
-        default=os.getenv("HUBSPOT_CLIENT_SECRET", ""),
+        default="",
         description="Used to establish and refresh OAuth authentication."
     )
     hubspot_redirect_uri: str = Field(
-        default=os.getenv("HUBSPOT_REDIRECT_URI", ""),
+        default="",
         description="The URI to redirect to after OAuth flow is complete."
     )
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
 
-settings = Settings()
+    # Server Settings
+    threadpool_size: int = Field(
+        default=100,
+        description="Worker threads available to sync endpoints and dependencies (Starlette defaults to 40)"
+    )
+
+    # CORS Settings
+    cors_origins: Annotated[List[str], NoDecode] = Field(
+        default=["https://app.akkizon.ai", "http://localhost:3000", "https://akkizon-ui.vercel.app"],
+        description="Origins allowed to make cross-origin requests (comma-separated in the environment)"
+    )
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore"
+    )
+
+    @field_validator("cors_origins", mode="before")
+    def split_cors_origins(cls, v):
+        if isinstance(v, str):
+            return [origin.strip() for origin in v.split(",") if origin.strip()]
+        return v
+
+@lru_cache()
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance."""
+    return Settings()
+
+settings = get_settings()
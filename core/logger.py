@@ -1,55 +1,118 @@
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import orjson
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 from pathlib import Path
 
-def setup_logger(
-    name: Optional[str] = None,
-    max_bytes: int = 1024 * 1024,  # 1MB
-    backup_count: int = 5
-) -> logging.Logger:
+_root_configured = False
+
+# Attributes every LogRecord carries; anything else was passed via `extra=`
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+class JSONFormatter(logging.Formatter):
     """
-    Configure and return a logger instance with standardized formatting and rotation.
-    
-    Args:
-        name: The name for the logger instance. If None, returns the root logger.
-        max_bytes: Maximum size of each log file in bytes before rotation occurs.
-        backup_count: Number of backup files to keep.
-    
-    Returns:
-        logging.Logger: Configured logger instance
+    Format log records as single-line JSON objects.
+
+    Fields passed through `extra=` are included as top-level keys, so call
+    sites can attach structured context instead of interpolating it into
+    the message.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "name": record.name,
+            "lvl": record.levelname,
+            "msg": record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Enqueue records untouched so formatting happens on the listener thread.
+
+    The default prepare() formats the message (and any traceback) on the
+    calling thread; the queue is in-process, so the original record can be
+    handed over as is.
     """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def _configure_root(max_bytes: int, backup_count: int) -> None:
+    """
+    Attach the shared console and file handlers to the root logger.
+
+    Runs once per process; named loggers reach these handlers through
+    propagation instead of each getting their own copies. The handlers sit
+    behind a queue drained by a background listener thread, so logging
+    calls never block on formatting, file writes or rotation.
+    """
+    global _root_configured
+    if _root_configured:
+        return
+
     # Create logs directory if it doesn't exist
     log_dir = Path('./logs')
     log_dir.mkdir(exist_ok=True)
-    
+
     # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = JSONFormatter()
 
     # Create handlers
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    
+
     # Use a single, shared log file for all modules
     file_handler = RotatingFileHandler(
         log_dir / 'server.log',  # Single log file for all modules
         maxBytes=max_bytes,
         backupCount=backup_count,
-        mode='a'  # Changed to append mode
+        mode='a',  # Changed to append mode
+        delay=True  # Open the file on first emit
     )
     file_handler.setFormatter(formatter)
 
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(_RecordQueueHandler(log_queue))
+    _root_configured = True
+
+@lru_cache(maxsize=None)
+def setup_logger(
+    name: Optional[str] = None,
+    max_bytes: int = 1024 * 1024,  # 1MB
+    backup_count: int = 5
+) -> logging.Logger:
+    """
+    Configure and return a logger instance with structured (JSON) formatting and rotation.
+
+    Handlers are created once and attached to the root logger; repeated calls
+    for the same name return the already-configured logger.
+
+    Args:
+        name: The name for the logger instance. If None, returns the root logger.
+        max_bytes: Maximum size of each log file in bytes before rotation occurs.
+        backup_count: Number of backup files to keep.
+
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    _configure_root(max_bytes, backup_count)
+
     # Get logger
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
-    
-    # Prevent adding handlers multiple times
-    if not logger.handlers:
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
 
-    return logger 
\ No newline at end of file
+    return logger
@@ -1,7 +1,10 @@
 # external imports
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import anyio.to_thread
+import sys
 
 # internal imports  
 from modules.authentication import authentication_router
@@ -9,9 +12,32 @@ from core.config import settings
 from modules.integration import integration_router
 from modules.integration.routes import hubspot_router
 from modules.projects import projects_router
+from modules.authentication.helpers import get_auth_handler
+from modules.authentication.clients import BigDataOAuthClient
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Sync endpoints and dependencies (including every Supabase call) run on
+    # this pool; the default 40 threads caps concurrent requests well below
+    # what the app can otherwise serve.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    # Open a pooled Supabase connection up front so the first request
+    # doesn't pay for it
+    try:
+        get_auth_handler().auth_client.client.table("api_keys").select("user_id").limit(1).execute()
+    except Exception:
+        logger.exception("Startup warm-up failed")
     yield
+    await BigDataOAuthClient.aclose()
+    # Release pooled connections to AI providers; the pool reopens on next use.
+    # The adapter (and the openai SDK behind it) is only imported by code paths
+    # that use it, so avoid paying that import just to close an unused pool.
+    base_client = sys.modules.get("core.adapter.base_client")
+    if base_client is not None:
+        await base_client.BaseAIClient.aclose()
 
 # Initialize the FastAPI application
 app = FastAPI(
@@ -22,6 +48,7 @@ app = FastAPI(
         "name": "Meet Ai Coders",
     },
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Include your router
@@ -33,7 +60,7 @@ app.include_router(projects_router)
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["https://app.akkizon.ai", "http://localhost:3000", "https://akkizon-ui.vercel.app"],
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -9,23 +9,31 @@ Classes:
 """
 
 # external imports
-from supabase import create_client, Client
+from supabase import Client
+from postgrest.types import ReturnMethod
 from fastapi import HTTPException
-import string
+from fastapi.concurrency import run_in_threadpool
+from cachetools import TLRUCache, TTLCache
+import asyncio
+import hashlib
 import secrets
-from httpx import AsyncClient
+import threading
+import time
+import jwt
+from functools import lru_cache, partial
+import httpx
 from urllib.parse import urlencode
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from pydantic import TypeAdapter
 
 # internal imports
 from core.config import settings
 from core.logger import setup_logger
+from utils.helper_funcs import get_anon_supabase_client, get_supabase_client
 from modules.authentication.base import AuthClientBase
 from modules.authentication.schemas import (
     AuthenticatedUser, 
     Organization, 
-    UserOrganization, 
-    APIKey,
     BearerToken,
     OrganizationWithRole,
     Profile
@@ -33,6 +41,60 @@ from modules.authentication.schemas import (
 
 logger = setup_logger(__name__)
 
+_ORGANIZATIONS_WITH_ROLE = TypeAdapter(List[OrganizationWithRole])
+
+# API key hash -> (user_id, organization_id). Only successful lookups are
+# cached, and keys are stored hashed so the cache never holds raw secrets.
+_API_KEY_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_API_KEY_CACHE_LOCK = threading.Lock()
+
+def _hash_api_key(api_key: str) -> str:
+    """SHA-256 hex digest of an API key, matching the indexed api_keys.key_hash column."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+def invalidate_api_key_cache(api_key: str) -> None:
+    """Drop a cached API key lookup, e.g. after the key is rotated or deleted."""
+    with _API_KEY_CACHE_LOCK:
+        _API_KEY_CACHE.pop(_hash_api_key(api_key), None)
+
+def _token_expiry(_key: bytes, value: tuple, now: float) -> float:
+    """Cached tokens expire after the configured TTL or when the token itself does."""
+    return min(now + settings.bearer_token_cache_ttl, value[1])
+
+# Bearer token SHA-256 digest -> (user_id, token expiry as a Unix timestamp)
+_TOKEN_CACHE: TLRUCache = TLRUCache(maxsize=10_000, ttu=_token_expiry, timer=time.time)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Bearer token SHA-256 digests recently rejected as invalid; short-lived and
+# bounded so replayed bad tokens skip verification without pinning memory
+_INVALID_TOKEN_CACHE: TTLCache = TTLCache(maxsize=20_000, ttl=10)
+_INVALID_TOKEN_CACHE_LOCK = threading.Lock()
+
+# (user_id, organization_id) pairs recently confirmed as members
+_MEMBERSHIP_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=settings.bearer_token_cache_ttl)
+_MEMBERSHIP_CACHE_LOCK = threading.Lock()
+
+# user_id -> organizations with roles; dropped whenever the user's memberships change
+_USER_ORGS_CACHE: TTLCache = TTLCache(maxsize=5_000, ttl=60)
+_USER_ORGS_CACHE_LOCK = threading.Lock()
+
+def _invalidate_user_organizations(user_id) -> None:
+    """Drop the cached organization list for a user."""
+    with _USER_ORGS_CACHE_LOCK:
+        _USER_ORGS_CACHE.pop(str(user_id), None)
+
+# Asymmetric signing algorithms verified against the project's published JWKS
+_JWKS_ALGORITHMS = ("RS256", "ES256")
+
+@lru_cache(maxsize=1)
+def _get_jwks_client() -> jwt.PyJWKClient:
+    """Return the JWKS client; signing keys are cached for 15 minutes and refetched on unknown kid."""
+    return jwt.PyJWKClient(
+        f"{settings.supabase_url}/auth/v1/.well-known/jwks.json",
+        cache_keys=True,
+        lifespan=900
+    )
+
 class SupabaseAuthClient(AuthClientBase):
     """
     Supabase authentication client for both API keys and Bearer tokens.
@@ -45,7 +107,7 @@ class SupabaseAuthClient(AuthClientBase):
     
     def __init__(self):
         """Initialize the Supabase client."""
-        self.client: Client = create_client(settings.supabase_url, settings.supabase_key)
+        self.client: Client = get_supabase_client()
 
 
     def get_user_from_api_key(self, api_key: str) -> AuthenticatedUser:
@@ -62,21 +124,32 @@ class SupabaseAuthClient(AuthClientBase):
             HTTPException: If API key is invalid
         """
         try:
-            logger.info(f"Getting user from api key")
-            response = self.client.table("api_keys").select("user_id, organization_id").eq("key", api_key).execute()
-            if not response.data:
-                logger.warning(f"Invalid API key provided")
-                raise HTTPException(status_code=401, detail="Invalid API key")
-            user_id = response.data[0]["user_id"]
-            organization_id = response.data[0]["organization_id"]
-            logger.info(f"Authenticated user: {user_id} with organization: {organization_id}")
-            return AuthenticatedUser(
+            logger.info("Getting user from api key")
+            key_hash = _hash_api_key(api_key)
+            with _API_KEY_CACHE_LOCK:
+                cached = _API_KEY_CACHE.get(key_hash)
+            if cached is not None:
+                user_id, organization_id = cached
+            else:
+                response = self.client.table("api_keys").select("user_id, organization_id").eq("key_hash", key_hash).limit(1).execute()
+                if not response.data:
+                    logger.warning("Invalid API key provided")
+                    raise HTTPException(status_code=401, detail="Invalid API key")
+                user_id = response.data[0]["user_id"]
+                organization_id = response.data[0]["organization_id"]
+                with _API_KEY_CACHE_LOCK:
+                    _API_KEY_CACHE[key_hash] = (user_id, organization_id)
+            logger.info("Authenticated user: %s with organization: %s", user_id, organization_id)
+            # Fields are already-checked strings (cache, DB or verified token), so skip validation
+            return AuthenticatedUser.model_construct(
                 success=True,
                 user_id=user_id,
                 organization_id=organization_id,
             )
+        except HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Failed to authenticate API key: {str(e)}", exc_info=True)
+            logger.error("Failed to authenticate API key: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail="Failed to verify API key")
     
     def get_user_from_bearer_token(self, access_token: str, organization_id: str = None) ->  AuthenticatedUser:
@@ -93,34 +166,148 @@ class SupabaseAuthClient(AuthClientBase):
             HTTPException: If Bearer token is invalid or user does not belong to the organization
         """
         try:
-            logger.info(f"Getting user from bearer token")
-            user = self.client.auth.get_user(access_token).user
-            if not user:
-                logger.warning("Invalid Bearer Token provided")
-                raise HTTPException(status_code=401, detail="Invalid Bearer Token")
-
-            user_id = user.id
+            logger.info("Getting user from bearer token")
+            user_id = self._verify_bearer_token(access_token)
             if organization_id is not None:
-                user_organization = (
-                    self.client.table("user_organizations")
-                    .select("*")
-                    .eq("user_id", user_id)
-                    .eq("organization_id", organization_id)
-                    .execute()
-                )
-                if not user_organization.data:
-                    logger.warning(f"User {user_id} does not belong to organization {organization_id}")
-                    raise HTTPException(status_code=401, detail="Unauthorized Organization Access")
-            logger.info(f"Authenticated user: {user_id} with organization: {organization_id}")
-            return AuthenticatedUser(success=True, user_id=user_id, organization_id=organization_id)
+                self._check_membership(user_id, organization_id)
+            logger.info("Authenticated user: %s with organization: %s", user_id, organization_id)
+            return AuthenticatedUser.model_construct(success=True, user_id=user_id, organization_id=organization_id)
+        except HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Multi-Organization Authentication Failed: {str(e)}", exc_info=True)
+            logger.error("Multi-Organization Authentication Failed: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail="Failed to verify token")
+
+    def _check_membership(self, user_id: str, organization_id: str) -> None:
+        """Ensure the user belongs to the organization.
+        
+        Confirmed memberships are cached for BEARER_TOKEN_CACHE_TTL seconds, so
+        repeat requests skip the user_organizations query. Rejections are
+        never cached.
+
+        Raises:
+            HTTPException: If the user does not belong to the organization
+        """
+        key = (user_id, organization_id)
+        with _MEMBERSHIP_CACHE_LOCK:
+            if key in _MEMBERSHIP_CACHE:
+                return
+
+        user_organization = (
+            self.client.table("user_organizations")
+            .select("user_id")
+            .eq("user_id", user_id)
+            .eq("organization_id", organization_id)
+            .limit(1)
+            .execute()
+        )
+        if not user_organization.data:
+            logger.warning("User %s does not belong to organization %s", user_id, organization_id)
+            raise HTTPException(status_code=401, detail="Unauthorized Organization Access")
+        with _MEMBERSHIP_CACHE_LOCK:
+            _MEMBERSHIP_CACHE[key] = True
+
+    def _verify_bearer_token(self, access_token: str) -> str:
+        """Verify a Supabase Bearer token and return its user ID.
+        
+        Successful verifications are cached (keyed by a hash of the token) for
+        BEARER_TOKEN_CACHE_TTL seconds or until the token expires, whichever
+        comes first. Rejected tokens are remembered for 10 seconds, so the same
+        bad token replayed in a burst is turned away without re-verifying it.
+        
+        Args:
+            access_token: The Bearer token to verify
+            
+        Returns:
+            The ID of the user the token was issued to
+
+        Raises:
+            HTTPException: If the Bearer token is invalid
+        """
+        token_hash = hashlib.sha256(access_token.encode()).digest()
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(token_hash)
+        if cached is not None:
+            return cached[0]
+        with _INVALID_TOKEN_CACHE_LOCK:
+            if token_hash in _INVALID_TOKEN_CACHE:
+                raise HTTPException(status_code=401, detail="Invalid Bearer Token")
+
+        try:
+            user_id, expires_at = self._decode_bearer_token(access_token)
+        except HTTPException as e:
+            if e.status_code == 401:
+                with _INVALID_TOKEN_CACHE_LOCK:
+                    _INVALID_TOKEN_CACHE[token_hash] = True
+            raise
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[token_hash] = (user_id, expires_at)
+        return user_id
+
+    def _decode_bearer_token(self, access_token: str) -> tuple:
+        """Verify a Supabase Bearer token and return its user ID and expiry.
+        
+        Tokens are verified locally, against the project's JWT secret (HS256)
+        or its published signing keys (RS256/ES256), which avoids a round-trip
+        to Supabase Auth on every request. Set SUPABASE_VERIFY_JWT_LOCALLY=false
+        to verify through Supabase Auth instead (e.g. where revoked sessions
+        must be rejected immediately).
+        """
+        if settings.supabase_verify_jwt_locally:
+            try:
+                payload = self._decode_jwt_locally(access_token)
+            except jwt.PyJWKClientError as e:
+                # Signing keys unavailable (e.g. mid key rotation); let Supabase Auth decide
+                logger.warning("JWKS lookup failed, verifying with Supabase Auth: %s", e)
+                payload = None
+            except jwt.PyJWTError as e:
+                logger.warning("Invalid Bearer Token provided: %s", e)
+                raise HTTPException(status_code=401, detail="Invalid Bearer Token")
+            if payload is not None:
+                return payload["sub"], payload["exp"]
+
+        user = self.client.auth.get_user(access_token).user
+        if not user:
+            logger.warning("Invalid Bearer Token provided")
+            raise HTTPException(status_code=401, detail="Invalid Bearer Token")
+        # Supabase Auth has already validated the token; read its expiry only
+        claims = jwt.decode(access_token, options={"verify_signature": False})
+        return user.id, claims.get("exp", float("inf"))
+
+    def _decode_jwt_locally(self, access_token: str) -> Optional[Dict[str, Any]]:
+        """Verify a JWT without calling Supabase Auth.
+        
+        Returns:
+            The token claims, or None if no local key is configured for its algorithm
+
+        Raises:
+            jwt.PyJWTError: If the token is invalid or its signing key cannot be resolved
+        """
+        algorithm = jwt.get_unverified_header(access_token).get("alg")
+        if algorithm == "HS256":
+            if not settings.supabase_jwt_secret:
+                return None
+            key = settings.supabase_jwt_secret
+        elif algorithm in _JWKS_ALGORITHMS:
+            key = _get_jwks_client().get_signing_key_from_jwt(access_token).key
+        else:
+            raise jwt.InvalidAlgorithmError(f"Unsupported token algorithm: {algorithm}")
+        return jwt.decode(
+            access_token,
+            key,
+            algorithms=[algorithm],
+            audience="authenticated",
+            options={"require": ["exp", "sub"]}
+        )
         
     def sign_in(self, email: str, password: str) -> BearerToken:
         """Sign in a user and return access/refresh tokens."""
         try:
-            response = self.client.auth.sign_in_with_password({
+            # Signing in stores the session on the client and switches its table
+            # queries to that user, so use a dedicated client rather than the
+            # shared one.
+            client = get_anon_supabase_client()
+            response = client.auth.sign_in_with_password({
                 "email": email,
                 "password": password
             })
@@ -134,7 +321,7 @@ class SupabaseAuthClient(AuthClientBase):
                 refresh_token=refresh_token
             )
         except Exception as e:
-            logger.error(f"Failed to sign in: {str(e)}", exc_info=True)
+            logger.error("Failed to sign in: %s", e, exc_info=True)
             raise
         
 class OrganizationClient:
@@ -142,66 +329,62 @@ class OrganizationClient:
     Client for managing organizations.
     """
     def __init__(self):
-        logger.info(f"Initializing OrganizationClient")
-        self.client: Client = create_client(settings.supabase_url, settings.supabase_key)
-
-    def generate_organization_for_user(self, user: AuthenticatedUser, organization: Organization) -> Organization:
-        """Generate an organization for a user."""
-        logger.info(f"Generating organization for user: {user.user_id}")
-        new_organization = self.add_organization(organization)  # Capture the returned organization
-        self.add_user_to_organization(user, new_organization)  # Use the new organization
-        self.generate_api_key(user, new_organization)  # Use the new organization
-        return new_organization  # Return the updated organization
-
-    def add_organization(self, organization: Organization) -> Organization:
-        """Add an organization to the database."""
-        try:
-            logger.info(f"Adding organization: {organization.name}")
-            response = self.client.table("organizations").insert({
-                "name": organization.name,
-            }).execute()
-            new_organization = Organization(**response.data[0])  # Changed variable name for clarity
-            return new_organization
-        except Exception as e:
-            logger.error(f"Failed to add organization: {str(e)}", exc_info=True)
-            raise
-    
-    def add_user_to_organization(self, user: AuthenticatedUser, organization: Organization) -> UserOrganization:
-        """Add a user to the specified organization."""
-        try:
-            logger.info(f"Adding {user.user_id} to {organization.id}")
-
-            response = self.client.table("user_organizations").insert({
-                "user_id": user.user_id,
-                "organization_id": organization.id
-            }).execute()
-            user_organization = UserOrganization(**response.data[0])
-            return user_organization
-        except Exception as e:
-            logger.error(f"Failed to add user to organization: {str(e)}", exc_info=True)
-            raise
-        
-    def generate_api_key(self, user: AuthenticatedUser, organization: Organization) -> APIKey:
-        """Generate an API key for the user in the specified organization."""
-        logger.info(f"Generating API key for {user.user_id}")
-        characters = string.ascii_letters + string.digits
-        api_key = ''.join(secrets.choice(characters) for _ in range(32))  # 32 characters long
+        logger.info("Initializing OrganizationClient")
+        self.client: Client = get_supabase_client()
+
+    def generate_organization_for_user(self, 
+                                       user: AuthenticatedUser, 
+                                       organization: Organization, 
+                                       set_default: bool = False,
+                                       profile_name: Optional[str] = None) -> Organization:
+        """
+        Generate an organization for a user.
+
+        The organization, the user's membership and the user's API key are
+        created by the create_org_with_owner database function in a single
+        transaction (one round-trip, no orphaned organization on failure).
+        With set_default, add_org_and_set_default also makes the new
+        organization the user's default and stores profile_name (which may
+        be None) on their profile in that same transaction.
+        """
         try:
-            response = self.client.table("api_keys").insert({
-                "user_id": user.user_id,
-                "organization_id": organization.id,
-                "key": api_key
-            }).execute() 
-            api_key_object = APIKey(**response.data[0])  # Changed variable name for clarity
-            return api_key_object
+            logger.info("Generating organization for user: %s", user.user_id)
+            params = {
+                "p_name": organization.name,
+                "p_user_id": user.user_id,
+                "p_api_key": self._generate_key()
+            }
+            if not set_default:
+                response = self.client.rpc("create_org_with_owner", params).execute()
+            else:
+                params["p_profile_name"] = profile_name
+                response = self.client.rpc("add_org_and_set_default", params).execute()
+            _invalidate_user_organizations(user.user_id)
+            # Row comes straight from our own insert, so skip re-validation
+            return Organization.model_construct(**response.data)
         except Exception as e:
-            logger.error(f"Failed to generate API key: {str(e)}", exc_info=True)
+            logger.error("Failed to generate organization: %s", e, exc_info=True)
             raise
-    
+
+    @staticmethod
+    def _generate_key() -> str:
+        """Generate a new random API key (32 URL-safe characters, 192 bits of entropy)."""
+        return secrets.token_urlsafe(24)
+
     def get_user_organizations(self, user: AuthenticatedUser):
-        """Get all organizations for a user as a list with roles."""
+        """Get all organizations for a user as a list with roles.
+        
+        Results are cached per user for 60 seconds and invalidated when this
+        client adds the user to an organization.
+        """
         try:
-            logger.info(f"Getting organizations for {user.user_id}")
+            logger.info("Getting organizations for %s", user.user_id)
+            key = str(user.user_id)
+            with _USER_ORGS_CACHE_LOCK:
+                cached = _USER_ORGS_CACHE.get(key)
+            if cached is not None:
+                return list(cached)
+
             # Use a join to fetch both user_organizations and organizations data
             response = self.client.table("user_organizations").select(
                 """
@@ -211,24 +394,47 @@ class OrganizationClient:
                 """
             ).eq("user_id", str(user.user_id)).execute()
             
-            # Build the list of organizations with the role included
-            organizations = [
-                OrganizationWithRole(
-                    id=org["organizations"]["id"],
-                    name=org["organizations"]["name"],
-                    role=org["role"],
-                    created_at=org["organizations"]["created_at"],
-                    updated_at=org["organizations"]["updated_at"]
-                )
-                for org in response.data
-            ]
+            # Build the list of organizations with the role included, validated in one call
+            organizations = _ORGANIZATIONS_WITH_ROLE.validate_python(
+                [{**org["organizations"], "role": org["role"]} for org in response.data]
+            )
+            with _USER_ORGS_CACHE_LOCK:
+                _USER_ORGS_CACHE[key] = organizations
             
-            return organizations
+            return list(organizations)
         except Exception as e:
-            logger.error(f"Failed to get user organizations: {str(e)}", exc_info=True)
+            logger.error("Failed to get user organizations: %s", e, exc_info=True)
             raise 
 
 class BigDataOAuthClient:
+    # Shared pool for token endpoint calls, so OAuth exchanges and refreshes
+    # reuse warm connections instead of opening a new pool per call.
+    _http: Optional[httpx.AsyncClient] = None
+
+    # Background OAuth state writes, held so they aren't garbage collected mid-flight
+    _pending: set = set()
+    # In-flight token refreshes per (connector, organization, user, project)
+    _refreshing: Dict[tuple, asyncio.Task] = {}
+
+    @staticmethod
+    def get_http() -> httpx.AsyncClient:
+        """Return the shared OAuth HTTP connection pool, opening it if it is not open."""
+        if BigDataOAuthClient._http is None or BigDataOAuthClient._http.is_closed:
+            BigDataOAuthClient._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+                timeout=httpx.Timeout(10.0, connect=3.0)
+            )
+        return BigDataOAuthClient._http
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Wait for pending background writes, then close the shared OAuth HTTP connection pool."""
+        await asyncio.gather(*cls._pending, return_exceptions=True)
+        http, BigDataOAuthClient._http = BigDataOAuthClient._http, None
+        if http is not None:
+            await http.aclose()
+
     def __init__(self, client: Client, **kwargs):
         """
         Initializes an OAuth client for different integrations.
@@ -239,6 +445,13 @@ class BigDataOAuthClient:
         """
         self.client = client
         self.params = kwargs  # Store all optional parameters dynamically
+        # Everything in the authorization URL except the per-flow state is fixed
+        self._auth_url_prefix = f"{self.get_param('auth_url')}?" + urlencode({
+            'client_id': self.get_param("client_id"),
+            'redirect_uri': self.get_param("redirect_uri"),
+            'response_type': 'code',
+            'scope': self.get_param("scope", "oauth")
+        })
 
     def get_param(self, key: str, default=None):
         """Helper to retrieve parameters safely.
@@ -258,20 +471,23 @@ class BigDataOAuthClient:
             state: The state to store
         """
         try:
-            self.client.table("oauth_states").insert({"state": state}).execute()
+            await run_in_threadpool(self.client.table("oauth_states").insert({"state": state}, returning=ReturnMethod.minimal).execute)
         except Exception as e:
-            logger.error(f"Error storing OAuth state: {e}")
+            logger.error("Error storing OAuth state: %s", e)
 
-    async def fetch_oauth_state(self, state: str) -> List[Dict[str, Any]]:
-        """Fetch OAuth state from the database.
+    async def consume_oauth_state(self, state: str) -> List[Dict[str, Any]]:
+        """Delete an OAuth state and return the deleted row(s).
+        
+        Checking and deleting in one statement keeps oauth_states limited to
+        in-flight flows and makes each state single-use.
         
         Args:
-            state: The state to fetch
+            state: The state to consume
             
         Returns:
-            The OAuth state from the database
+            The deleted OAuth state, or an empty list if it did not exist
         """
-        response = self.client.table("oauth_states").select("*").eq("state", state).execute()
+        response = await run_in_threadpool(self.client.table("oauth_states").delete().eq("state", state).execute)
         return response.data
     
     async def initiate_oauth_flow(self) -> str:
@@ -282,19 +498,15 @@ class BigDataOAuthClient:
         """
         state = secrets.token_urlsafe(32)  # Generate secure random state
         
-        # Store the state in the database for CSRF protection
-        await self.store_oauth_state(state)
-
-        params = {
-            'client_id': self.get_param("client_id"),
-            'redirect_uri': self.get_param("redirect_uri"),
-            'response_type': 'code',
-            'scope': self.get_param("scope", "oauth"),
-            'state': state
-        }
-
-        auth_url = f"{self.get_param('auth_url')}?{urlencode(params)}"
-        return auth_url
+        # Store the state in the database for CSRF protection. The row is only
+        # needed once the provider redirects back, so don't hold up the URL;
+        # a failed write is logged and the user simply retries the flow.
+        task = asyncio.create_task(self.store_oauth_state(state))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+        # token_urlsafe output needs no further URL encoding
+        return f"{self._auth_url_prefix}&state={state}"
     
     async def exchange_code(self, 
                             code: str, 
@@ -311,7 +523,7 @@ class BigDataOAuthClient:
         Returns:
             The tokens from the database
         """
-        oauth_state = await self.fetch_oauth_state(state)
+        oauth_state = await self.consume_oauth_state(state)
         if not oauth_state:
             raise Exception("Invalid OAuth state")
         if not code:
@@ -328,22 +540,21 @@ class BigDataOAuthClient:
 
         headers = {"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"}
         
-        async with AsyncClient() as client:
-            response = await client.post(token_url, data=data, headers=headers)
-            
-            if response.status_code != 200:
-                error_data = response.json()
-                logger.error(f"Token exchange failed: {error_data}")
-                raise Exception(f"Token exchange failed: {error_data}")
-
-            token_data = response.json()
-            await self.store_tokens(
-                token_data=token_data, 
-                connector_id=connector_id, 
-                organization_id=organization_id, 
-                user_id=user_id, 
-                project_id=project_id)
-            return token_data
+        response = await self.get_http().post(token_url, data=data, headers=headers)
+        
+        if response.status_code != 200:
+            error_data = response.json()
+            logger.error("Token exchange failed: %s", error_data)
+            raise Exception(f"Token exchange failed: {error_data}")
+
+        token_data = response.json()
+        await self.store_tokens(
+            token_data=token_data, 
+            connector_id=connector_id, 
+            organization_id=organization_id, 
+            user_id=user_id, 
+            project_id=project_id)
+        return token_data
 
     async def store_tokens(self, 
                            token_data: Dict[str, Any], 
@@ -371,7 +582,7 @@ class BigDataOAuthClient:
             raise Exception("No project ID provided")
         
         try:
-            self.client.table("user_connectors").upsert({
+            await run_in_threadpool(self.client.table("user_connectors").upsert({
                 "connector_id": connector_id,
                 "organization_id": organization_id,
                 "user_id": user_id,
@@ -380,9 +591,9 @@ class BigDataOAuthClient:
                 "refresh_token": token_data.get("refresh_token"),
                 "expires_at": token_data.get("expires_at"),
                 "scope": token_data.get("scope")
-            }).execute()
+            }, returning=ReturnMethod.minimal).execute)
         except Exception as e:
-            logger.error(f"Error storing tokens: {e}")
+            logger.error("Error storing tokens: %s", e)
 
     async def refresh_access_token(self, 
                                    connector_id: str, 
@@ -391,15 +602,46 @@ class BigDataOAuthClient:
                                    project_id: str) -> Dict[str, Any]:
         """Refresh access token using the refresh token.
         
+        Concurrent refreshes of the same connection share one call to the
+        token endpoint and one write, instead of racing each other.
+        
         Args:
             connector_id: The connector ID
             organization_id: The organization ID
             user_id: The user ID
             project_id: The project ID
         """
+        key = (connector_id, organization_id, user_id, project_id)
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh_access_token(*key))
+            self._refreshing[key] = task
+            task.add_done_callback(partial(self._refresh_done, key))
+        # Shield so one caller being cancelled doesn't cancel the refresh for the others
+        return await asyncio.shield(task)
+
+    @classmethod
+    def _refresh_done(cls, key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished refresh and mark its exception as retrieved.
+        
+        If every awaiting caller was cancelled, nobody else reads the
+        outcome, and asyncio would log "Task exception was never retrieved".
+        """
+        if cls._refreshing.get(key) is task:
+            del cls._refreshing[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _refresh_access_token(self, 
+                                    connector_id: str, 
+                                    organization_id: str, 
+                                    user_id: str, 
+                                    project_id: str) -> Dict[str, Any]:
+        """Exchange the stored refresh token for a new access token and store it."""
         token_url = self.get_param("token_url")
         # Fetch refresh token from the database
-        refresh_token = self.get_refresh_token(connector_id, organization_id, user_id, project_id)
+        tokens = await self._get_tokens(connector_id, organization_id, user_id, project_id)
+        refresh_token = tokens["refresh_token"] if tokens else None
 
         if not refresh_token:
             raise Exception("No refresh token found. Re-authentication required.")
@@ -413,42 +655,68 @@ class BigDataOAuthClient:
 
         headers = {"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"}
 
-        async with AsyncClient() as client:
-            response = await client.post(token_url, data=data, headers=headers)
-
-            if response.status_code != 200:
-                error_data = response.json()
-                logger.error(f"Token refresh failed: {error_data}")
-                raise Exception("Token refresh failed")
-
-            new_token_data = response.json()
-            await self.store_tokens(new_token_data)
-            return new_token_data
+        response = await self.get_http().post(token_url, data=data, headers=headers)
+
+        if response.status_code != 200:
+            error_data = response.json()
+            logger.error("Token refresh failed: %s", error_data)
+            raise Exception("Token refresh failed")
+
+        new_token_data = response.json()
+        # Providers that don't rotate refresh tokens omit it from the response
+        new_token_data.setdefault("refresh_token", refresh_token)
+        await self.store_tokens(
+            token_data=new_token_data,
+            connector_id=connector_id,
+            organization_id=organization_id,
+            user_id=user_id,
+            project_id=project_id)
+        return new_token_data
     
-    async def get_access_token(self, 
-                               connector_id: str, 
-                               organization_id: str, 
-                               user_id: str, 
-                               project_id: str) -> Dict[str, Any]:
-        """Get the OAuth token for the user.
+    async def _get_tokens(self, 
+                          connector_id: str, 
+                          organization_id: str, 
+                          user_id: str, 
+                          project_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch the stored access token, refresh token and expiry in one query.
         
         Args:
             connector_id: The connector ID
             organization_id: The organization ID
             user_id: The user ID
             project_id: The project ID
+            
+        Returns:
+            The token row, or None if the user has not connected
         """
-        response = (
+        response = await run_in_threadpool(
             self.client.table("user_connectors")
-            .select("access_token")
+            .select("access_token, refresh_token, expires_at")
             .eq("connector_id", connector_id)
             .eq("organization_id", organization_id)
             .eq("user_id", user_id)
             .eq("project_id", project_id)
-            .single()
-            .execute()
+            .maybe_single()
+            .execute
         )
-        return response.data[0]["access_token"]
+        # maybe_single() yields no response at all when the row is missing
+        return response.data if response else None
+
+    async def get_access_token(self, 
+                               connector_id: str, 
+                               organization_id: str, 
+                               user_id: str, 
+                               project_id: str) -> Dict[str, Any]:
+        """Get the OAuth token for the user.
+        
+        Args:
+            connector_id: The connector ID
+            organization_id: The organization ID
+            user_id: The user ID
+            project_id: The project ID
+        """
+        tokens = await self._get_tokens(connector_id, organization_id, user_id, project_id)
+        return tokens["access_token"] if tokens else None
 
     async def get_refresh_token(self, 
                                 connector_id: str, 
@@ -463,17 +731,8 @@ class BigDataOAuthClient:
             user_id: The user ID
             project_id: The project ID
         """
-        response = (
-            self.client.table("user_connectors")
-            .select("refresh_token")
-            .eq("connector_id", connector_id)
-            .eq("organization_id", organization_id)
-            .eq("user_id", user_id)
-            .eq("project_id", project_id)
-            .single()
-            .execute()
-        )
-        return response.data[0]["refresh_token"]
+        tokens = await self._get_tokens(connector_id, organization_id, user_id, project_id)
+        return tokens["refresh_token"] if tokens else None
     
 
 class ProfileClient:
@@ -481,21 +740,23 @@ class ProfileClient:
         self.client = client
         self.table_name = table_name
 
-    def fetch_user_profile(self, user_id: str) -> Profile:
-        response = self.client.table(self.table_name).select("*").eq("id", user_id).execute()
-        return response.data
+    def fetch_user_profile(self, user_id: str) -> Optional[Profile]:
+        """Fetch a user's profile, or None if they have not created one yet."""
+        response = (
+            self.client.table(self.table_name)
+            .select("id, name, default_organization, created_at")
+            .eq("id", user_id)
+            .maybe_single()
+            .execute()
+        )
+        # maybe_single() yields no response at all when the row is missing
+        return Profile(**response.data) if response else None
 
     def update_default_organization(self, user_id: str, user_name: str, default_organization: str) -> Profile:
-        existing_profile = self.client.table(self.table_name).select("*").eq("id", user_id).execute()
-        if existing_profile.data:
-            response = self.client.table(self.table_name).update({
-                "name": user_name,
-                "default_organization": default_organization
-            }).eq("id", user_id).execute()
-        else:
-            response = self.client.table(self.table_name).insert({
-                "id": user_id,
-                "name": user_name,
-                "default_organization": default_organization
-            }).execute()
-        return response.data
\ No newline at end of file
+        """Create the user's profile or update its name and default organization, in one upsert."""
+        response = self.client.table(self.table_name).upsert({
+            "id": user_id,
+            "name": user_name,
+            "default_organization": default_organization
+        }).execute()
+        return response.data
@@ -10,6 +10,7 @@ Classes:
 """
 
 # external imports
+import re
 from fastapi import HTTPException
 from typing import Optional
 
@@ -20,6 +21,15 @@ from core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Structural shape of a JWT (three base64url segments); anything else can be
+# rejected without a signature check or a round-trip to Supabase Auth
+_JWT_RE = re.compile(r"\A[A-Za-z0-9_-]{8,}\.[A-Za-z0-9_-]{8,}\.[A-Za-z0-9_-]{8,}\Z")
+MAX_TOKEN_LENGTH = 4096
+
+def _is_well_formed_token(access_token: str) -> bool:
+    """Cheap structural check on a Bearer token before it is verified."""
+    return len(access_token) <= MAX_TOKEN_LENGTH and _JWT_RE.match(access_token) is not None
+
 class AuthenticationHandler:
     """
     Handles authentication using both Bearer tokens and API keys.
@@ -75,6 +85,8 @@ class AuthenticationHandler:
                     status_code=400,
                     detail="Organization ID is required for Bearer token authentication"
                 )
+            if not _is_well_formed_token(access_token):
+                raise HTTPException(status_code=401, detail="Invalid Bearer Token")
             return self.auth_client.get_user_from_bearer_token(access_token, organization_id)
 
         raise HTTPException(status_code=401, detail="Authentication required")
@@ -95,18 +107,20 @@ class AuthenticationHandler:
         Raises:
             HTTPException: If authentication fails
         """
+        if not _is_well_formed_token(access_token):
+            raise HTTPException(status_code=401, detail="Invalid Bearer Token")
         try:
             user = self.auth_client.get_user_from_bearer_token(access_token, None)
             return user
         except Exception as e:
-            raise HTTPException(status_code=401, detail="Authentication failed")
+            raise HTTPException(status_code=401, detail="Invalid Bearer Token")
 
 class OrganizationHandler:
     def __init__(self, organization_client: OrganizationClient):
         self.organization_client = organization_client
 
-    def generate_organization_for_user(self, user: AuthenticatedUser, organization: Organization):
-        return self.organization_client.generate_organization_for_user(user, organization)
+    def generate_organization_for_user(self, user: AuthenticatedUser, organization: Organization, set_default: bool = False, profile_name: Optional[str] = None):
+        return self.organization_client.generate_organization_for_user(user, organization, set_default, profile_name)
     
     def get_user_organizations(self, user: AuthenticatedUser):
         return self.organization_client.get_user_organizations(user)
@@ -1,7 +1,7 @@
 # external imports
-from functools import lru_cache
 from fastapi import Depends, HTTPException, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
+from functools import cache
 from typing import Optional
 
 # internal imports
@@ -16,10 +16,12 @@ logger = setup_logger(__name__)
 auth_scheme = HTTPBearer(auto_error=False)  # Make Bearer optional
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
-@lru_cache()
+# Process-wide handlers, built on first use
+@cache
 def get_auth_handler() -> AuthenticationHandler:
     return AuthenticationHandler(SupabaseAuthClient())
 
+@cache
 def get_organization_handler() -> OrganizationHandler:
     return OrganizationHandler(OrganizationClient())
 
@@ -38,7 +40,8 @@ def get_authenticated_user(
         organization_id: Organization ID from headers (required for Bearer token)
         
     Returns:
-        AuthenticatedUser: Contains authenticated user information
+        AuthenticatedUser: Contains authenticated user information. Failures
+        raise instead of returning, so routes can rely on `success` being True.
         
     Raises:
         HTTPException: If authentication fails or organization ID is missing for Bearer token
@@ -62,7 +65,7 @@ def get_authenticated_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Authentication failed: {str(e)}", exc_info=True)
+        logger.error("Authentication failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error during authentication")
 
 def get_authenticated_user_without_org(
@@ -78,7 +81,8 @@ def get_authenticated_user_without_org(
         api_key: Optional API key
         
     Returns:
-        AuthenticatedUser: Contains authenticated user information
+        AuthenticatedUser: Contains authenticated user information. Failures
+        raise instead of returning, so routes can rely on `success` being True.
         
     Raises:
         HTTPException: If authentication fails
@@ -101,13 +105,9 @@ def get_authenticated_user_without_org(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Authentication failed: {str(e)}", exc_info=True)
+        logger.error("Authentication failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error during authentication")
 
-def add_organization(user: AuthenticatedUser):
-    organization_handler = get_organization_handler()
-    organization_handler.add_organization(user)
-
-
+@cache
 def get_profile_client() -> ProfileClient:
     return ProfileClient(get_supabase_client())
\ No newline at end of file
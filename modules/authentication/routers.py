@@ -1,5 +1,9 @@
+import asyncio
 from fastapi import APIRouter, Depends, Body, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from typing import Awaitable, TypeVar
+from core.logger import setup_logger
 from modules.authentication.helpers import (
     get_authenticated_user, 
     get_authenticated_user_without_org, 
@@ -8,11 +12,16 @@ from modules.authentication.helpers import (
     get_profile_client
 )
 from modules.authentication.schemas import (
+    AddOrganizationRequest,
     AuthenticatedUser,
-    Organization,
-    Profile
+    Profile,
+    SignInRequest,
+    SignInResponse
 )
 
+T = TypeVar("T")
+
+logger = setup_logger(__name__)
 router = APIRouter()
 
 @router.get("/verify-user")
@@ -21,17 +30,15 @@ def verify_user(user: AuthenticatedUser = Depends(get_authenticated_user)):
 
 @router.post("/add-organization")
 def add_organization(
-    user: AuthenticatedUser = Depends(get_authenticated_user_without_org),
-    organization: Organization = Body(...),
-    profile: Profile = Body(...)
+    body: AddOrganizationRequest,
+    user: AuthenticatedUser = Depends(get_authenticated_user_without_org)
 ):
     try:
         organization_handler = get_organization_handler()
-        profile_client = get_profile_client()
-        new_organization = organization_handler.generate_organization_for_user(user, organization)
-        if new_organization.id:
-            profile_client.update_default_organization(user.user_id, profile.name, new_organization.id)
-        return new_organization
+        # Creates the organization and makes it the user's default in one transaction
+        return organization_handler.generate_organization_for_user(
+            user, body.organization, set_default=True, profile_name=body.profile.name
+        )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -47,13 +54,33 @@ def get_user_organizations(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _or_default(call: Awaitable[T], default: T, what: str) -> T:
+    """Await a sign-in side lookup, logging a failure and returning default instead."""
+    try:
+        return await call
+    except Exception as e:
+        logger.error("Failed to load %s after sign-in: %s", what, e, exc_info=True)
+        return default
+
 @router.post('/sign-in')
-def sign_in(
-    email: str = Body(...),
-    password: str = Body(...)
-):
-    auth_handler = get_auth_handler().auth_client.sign_in(email=email, password=password)
-    return auth_handler
+async def sign_in(body: SignInRequest) -> SignInResponse:
+    auth_handler = get_auth_handler()
+    tokens = await run_in_threadpool(auth_handler.auth_client.sign_in, email=body.email, password=body.password)
+    # Return the profile and organizations with the tokens so the dashboard
+    # doesn't need two more requests. Verifying the new token also primes
+    # the token cache for those requests.
+    # The credentials are already accepted at this point, so a failure here
+    # must not cost the user their tokens; the dashboard can load these later.
+    try:
+        user = await run_in_threadpool(auth_handler.authenticate_without_org, tokens.access_token)
+    except Exception as e:
+        logger.error("Failed to verify new session after sign-in: %s", e, exc_info=True)
+        return SignInResponse(**tokens.model_dump())
+    profile, organizations = await asyncio.gather(
+        _or_default(run_in_threadpool(get_profile_client().fetch_user_profile, user.user_id), None, "profile"),
+        _or_default(run_in_threadpool(get_organization_handler().get_user_organizations, user), [], "organizations")
+    )
+    return SignInResponse(**tokens.model_dump(), profile=profile, organizations=organizations)
     
 @router.get("/fetch-user-profile")
 def fetch_user_profile(
@@ -70,4 +97,4 @@ def update_default_organization(
 ):
     profile_client = get_profile_client()
     profile_client.update_default_organization(user.user_id, profile.name, profile.default_organization)
-    return JSONResponse(content={"message": "Default organization updated successfully"})
\ No newline at end of file
+    return ORJSONResponse(content={"message": "Default organization updated successfully"})
\ No newline at end of file
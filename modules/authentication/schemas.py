@@ -1,9 +1,11 @@
 # external imports
-from pydantic import BaseModel, field_validator
-from typing import Optional
-from uuid import UUID
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
 from datetime import datetime
 
+# internal imports
+from shared.utils import UUIDStr
+
 # Authenticated User Model
 class AuthenticatedUser(BaseModel):
     success: bool
@@ -11,92 +13,57 @@ class AuthenticatedUser(BaseModel):
     organization_id: Optional[str] = None
 
 class Organization(BaseModel):
-    id: Optional[str] = None
+    id: Optional[UUIDStr] = None
     name: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    @field_validator('id')
-    def validate_uuid(cls, v):
-        if v is not None:
-            try:
-                UUID(v)
-                return v
-            except ValueError:
-                raise ValueError(f"Invalid UUID format: {v}")
-        return v
-
 # API Key Model
 class APIKey(BaseModel):
-    id: Optional[str] = None
-    user_id: Optional[str] = None
-    organization_id: Optional[str] = None
+    id: Optional[UUIDStr] = None
+    user_id: Optional[UUIDStr] = None
+    organization_id: Optional[UUIDStr] = None
     key: str
     created_at: Optional[datetime] = None
     last_used: Optional[datetime] = None
     usage_count: Optional[int] = 0
 
-    @field_validator('id', 'user_id', 'organization_id')
-    def validate_uuid(cls, v):
-        if v is not None:
-            try:
-                UUID(v)
-                return v
-            except ValueError:
-                raise ValueError(f"Invalid UUID format: {v}")
-        return v
-
 # User Organization Model
 class UserOrganization(BaseModel):
-    user_id: Optional[str] = None
-    organization_id: Optional[str] = None
+    model_config = ConfigDict(from_attributes=True)
+
+    user_id: Optional[UUIDStr] = None
+    organization_id: Optional[UUIDStr] = None
     role: Optional[str] = "member"
     created_at: Optional[datetime] = None
 
-    @field_validator('user_id', 'organization_id')
-    def validate_uuid(cls, v):
-        if v is not None:
-            try:
-                UUID(v)
-                return v
-            except ValueError:
-                raise ValueError(f"Invalid UUID format: {v}")
-        return v
-
-    class Config:
-        from_attributes = True
-
 class BearerToken(BaseModel):
     access_token: str
     refresh_token: str
 
 class OrganizationWithRole(BaseModel):
-    id: str
+    id: UUIDStr
     name: str
     role: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    @field_validator('id')
-    def validate_uuid(cls, v):
-        try:
-            UUID(v)
-            return v
-        except ValueError:
-            raise ValueError(f"Invalid UUID format: {v}")
-
 class Profile(BaseModel):
-    id: Optional[str] = None
+    id: Optional[UUIDStr] = None
     name: Optional[str] = None
     default_organization: Optional[str] = None
     created_at: Optional[datetime] = None
-    
-    @field_validator('id')
-    def validate_uuid(cls, v):
-        if v is not None:
-            try:
-                UUID(v)
-                return v
-            except ValueError:
-                raise ValueError(f"Invalid UUID format: {v}")
-        return v
\ No newline at end of file
+
+class SignInResponse(BearerToken):
+    """Tokens plus what the dashboard loads right after signing in."""
+    profile: Optional[Profile] = None
+    organizations: List[OrganizationWithRole] = []
+
+# Request Bodies
+class SignInRequest(BaseModel):
+    email: str
+    password: str
+
+class AddOrganizationRequest(BaseModel):
+    organization: Organization
+    profile: Profile
@@ -1,4 +1,7 @@
 # External imports
+import asyncio
+from fastapi.concurrency import run_in_threadpool
+from cachetools import TTLCache
 from typing import List, Dict, Any
 
 # Internal imports
@@ -9,6 +12,13 @@ from core.config import settings
 
 logger = setup_logger(__name__)
 
+# Default connectors are shared reference data that rarely changes
+_DEFAULT_CONNECTORS_CACHE: TTLCache = TTLCache(maxsize=1, ttl=60)
+
+def invalidate_default_connectors() -> None:
+    """Drop the cached default connectors, e.g. after data_connectors is edited."""
+    _DEFAULT_CONNECTORS_CACHE.clear()
+
 
 class ConnectorClient:
     """
@@ -22,17 +32,23 @@ class ConnectorClient:
     async def fetch_default_connectors(self) -> List[Dict[str, Any]]:
         """
         Fetch all default connectors from the database.
+
+        Results are cached in-process for 60 seconds.
         Args:
             None
         Returns:
             List[Dict[str, Any]]: A list of dictionaries containing connector information.
         """
+        cached = _DEFAULT_CONNECTORS_CACHE.get(self.data_connector_table)
+        if cached is not None:
+            return list(cached)
         try:
-            logger.info(f"Fetching default connectors...")
-            response = self.client.table(self.data_connector_table).select("*").execute()
-            return response.data
+            logger.info("Fetching default connectors...")
+            response = await run_in_threadpool(self.client.table(self.data_connector_table).select("*").execute)
+            _DEFAULT_CONNECTORS_CACHE[self.data_connector_table] = response.data
+            return list(response.data)
         except Exception as e:
-            logger.error(f"Failed to fetch default connectors: {str(e)}")
+            logger.error("Failed to fetch default connectors: %s", e)
             raise e
     
     async def fetch_all_connectors_for_user(self, user_id: str, organization_id: str, project_id: str) -> List[Dict[str, Any]]:
@@ -48,20 +64,40 @@ class ConnectorClient:
             List[Dict[str, Any]]: A list of dictionaries containing connector information.
         """
         try:
-            logger.info(f"Fetching connectors for user {user_id}...")
-            response = (
+            logger.info("Fetching connectors for user %s...", user_id)
+            # Never return the stored OAuth tokens to API clients
+            response = await run_in_threadpool(
                 self.client.table(self.user_connector_table)
-                .select("*")
+                .select("connector_id, organization_id, user_id, project_id, expires_at, scope")
                 .eq("user_id", user_id)
                 .eq("organization_id", organization_id)
                 .eq("project_id", project_id)
-                .execute()
+                .execute
             )
             return response.data
         except Exception as e:
-            logger.error(f"Failed to fetch connectors: {str(e)}")
+            logger.error("Failed to fetch connectors: %s", e)
             raise e
     
+    async def fetch_connector_bundle(self, user_id: str, organization_id: str, project_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch the default connectors and the user's connectors concurrently.
+
+        Args:
+            user_id: str
+            organization_id: str
+            project_id: str
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: The default connectors under "default_connectors"
+            and the user's connectors under "user_connectors".
+        """
+        default_connectors, user_connectors = await asyncio.gather(
+            self.fetch_default_connectors(),
+            self.fetch_all_connectors_for_user(user_id, organization_id, project_id)
+        )
+        return {"default_connectors": default_connectors, "user_connectors": user_connectors}
+
     async def delete_connector_of_user(self, connector_id: str, organization_id: str, user_id: str, project_id: str) -> None:
         """
         Delete a connector of a user.
@@ -72,10 +108,10 @@ class ConnectorClient:
             project_id: str
         """
         try:
-            logger.info(f"Deleting connector {connector_id} for user {user_id}...")
-            self.client.table(self.user_connector_table).delete().eq("connector_id", connector_id).eq("organization_id", organization_id).eq("user_id", user_id).eq("project_id", project_id).execute()
+            logger.info("Deleting connector %s for user %s...", connector_id, user_id)
+            await run_in_threadpool(self.client.table(self.user_connector_table).delete().eq("connector_id", connector_id).eq("organization_id", organization_id).eq("user_id", user_id).eq("project_id", project_id).execute)
         except Exception as e:
-            logger.error(f"Failed to delete connector: {str(e)}")
+            logger.error("Failed to delete connector: %s", e)
             raise e
         
 class HubSpotConnector(BigDataOAuthClient):
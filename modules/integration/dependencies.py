@@ -1,11 +1,15 @@
+from functools import lru_cache
+
 from modules.integration.clients import ConnectorClient, HubSpotConnector
 
+@lru_cache()
 def get_connector_client() -> ConnectorClient:
     """
     Get a connector client based on the connector type.
     """
     return ConnectorClient()
 
+@lru_cache()
 def get_hubspot_connector_client() -> HubSpotConnector:
     """
     Get a HubSpot connector client.
@@ -1,5 +1,6 @@
 # external imports
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
 
 # internal imports
 from core.logger import setup_logger
@@ -8,29 +9,35 @@ from modules.authentication.schemas import AuthenticatedUser
 from modules.integration.dependencies import get_connector_client
 from modules.integration.clients import ConnectorClient
 from modules.integration.schemas import (
-    DeleteConnectorOfUserRequest
+    DeleteConnectorOfUserRequest,
+    ProjectScopedRequest
 )
 
 logger = setup_logger(__name__)
 router = APIRouter(prefix="/v1/integration", tags=["integration"])
 
-@router.post("/fetch-default-connectors")
+@router.post("/fetch-default-connectors", response_class=ORJSONResponse, response_model=None)
 async def fetch_default_connectors(
     user: AuthenticatedUser = Depends(get_authenticated_user), 
     connector_client: ConnectorClient = Depends(get_connector_client)
     ):
-    if not user.success:
-        raise HTTPException(status_code=401, detail="Unauthorized")
-    return await connector_client.fetch_default_connectors()
+    return ORJSONResponse(content=await connector_client.fetch_default_connectors())
 
-@router.post("/fetch_all_connectors_for_user")
+@router.post("/fetch_all_connectors_for_user", response_class=ORJSONResponse, response_model=None)
 async def fetch_all_connectors_for_user(
+    request: ProjectScopedRequest,
     user: AuthenticatedUser = Depends(get_authenticated_user),
     connector_client: ConnectorClient = Depends(get_connector_client)
     ):
-    if not user.success:
-        raise HTTPException(status_code=401, detail="Unauthorized")
-    return await connector_client.fetch_all_connectors_for_user(user.user.id, user.organization.id, user.project.id)
+    return ORJSONResponse(content=await connector_client.fetch_all_connectors_for_user(user.user_id, user.organization_id, request.project_id))
+
+@router.post("/fetch-connector-bundle", response_class=ORJSONResponse, response_model=None)
+async def fetch_connector_bundle(
+    request: ProjectScopedRequest,
+    user: AuthenticatedUser = Depends(get_authenticated_user),
+    connector_client: ConnectorClient = Depends(get_connector_client)
+    ):
+    return ORJSONResponse(content=await connector_client.fetch_connector_bundle(user.user_id, user.organization_id, request.project_id))
 
 @router.post("/delete_connector_of_user")
 async def delete_connector_of_user(
@@ -38,11 +45,9 @@ async def delete_connector_of_user(
     user: AuthenticatedUser = Depends(get_authenticated_user),
     connector_client: ConnectorClient = Depends(get_connector_client)
     ):
-    if not user.success:
-        raise HTTPException(status_code=401, detail="Unauthorized")
     return await connector_client.delete_connector_of_user(
         connector_id=request.connector_id,
-        organization_id=user.organization.id,
+        organization_id=user.organization_id,
         user_id=user.user_id,
         project_id=request.project_id
     )
\ No newline at end of file
@@ -1,6 +1,6 @@
 # external imports
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 # internal imports
 from core.logger import setup_logger
@@ -22,7 +22,7 @@ async def initiate_oauth_flow(
     ):
     """Initiate HubSpot OAuth flow"""
     oauth_url = await hubspot_connector.initiate_oauth_flow()
-    return JSONResponse(
+    return ORJSONResponse(
         content={"url": oauth_url},
         status_code=200
     )
@@ -48,11 +48,11 @@ async def hubspot_oauth_callback(
             code=params.code, 
             state=params.state, 
             connector_id=params.connector_id, 
-            organization_id=user.organization.id, 
+            organization_id=user.organization_id, 
             user_id=user.user_id, 
             project_id=params.project_id)
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={"message": "HubSpot account connected successfully"},
             status_code=200
         )
@@ -1,9 +1,17 @@
 from pydantic import BaseModel, Field
 
+from shared.utils import UUIDStr
+
 class DeleteConnectorOfUserRequest(BaseModel):
     connector_id: str
     project_id: str
 
+class ProjectScopedRequest(BaseModel):
+    """
+    Body for connector endpoints that operate within a single project.
+    """
+    project_id: UUIDStr
+
 class HubSpotCallbackQueryParams(BaseModel):
     """
     Model for HubSpot OAuth callback request.
@@ -1,10 +1,29 @@
-from typing import Any, Dict, List
+import threading
+from cachetools import TTLCache
+from typing import Any, Dict, Iterator, List, Optional
+from postgrest.exceptions import APIError
 from utils.helper_funcs import get_supabase_client
 from core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# (user_id, organization_id) -> project rows, and
+# (project_id, user_id, organization_id) -> project row. Both are dropped
+# for the owner whenever add_project writes.
+_PROJECT_LIST_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_PROJECT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_PROJECT_CACHE_LOCK = threading.Lock()
+
+def invalidate_project_cache() -> None:
+    """Drop all cached project reads, e.g. after the projects table is edited directly."""
+    with _PROJECT_CACHE_LOCK:
+        _PROJECT_LIST_CACHE.clear()
+        _PROJECT_CACHE.clear()
+
 class ProjectClient:
+    # Columns returned by the read and insert methods
+    SELECT_COLUMNS = "id, name, user_id, organization_id, created_at"
+
     def __init__(self, table_name: str = "projects"):
         """
         Initialize the ProjectsClient.
@@ -32,80 +51,161 @@ class ProjectClient:
             if not project_id or not user_id or not organization_id:
                 raise ValueError("Missing required fields")
             
-            # Check if the project already exists
-            existing_project = self.fetch_project_by_id(project_id, user_id, organization_id)
-            if existing_project:
-                raise ValueError(f"Project with id {project_id} already exists.")
-            
-            if not project_name:
-                logger.info(f"Project name is not provided, generating random name")
-                project_name = self._generate_random_name(user_id, organization_id)
+            # The add_project database function numbers unnamed projects and
+            # inserts the row in one transaction
+            logger.info("Adding project: %s for user: %s and organization: %s", project_name or "(untitled)", user_id, organization_id)
+            response = self.client.rpc("add_project", {
+                "p_id": project_id,
+                "p_name": project_name,
+                "p_user_id": user_id,
+                "p_organization_id": organization_id
+            }).select(self.SELECT_COLUMNS).execute()
+
+            with _PROJECT_CACHE_LOCK:
+                _PROJECT_LIST_CACHE.pop((user_id, organization_id), None)
+                _PROJECT_CACHE.pop((project_id, user_id, organization_id), None)
+            return response.data
+        except APIError as e:
+            if e.code == "23505":  # unique_violation on the project ID
+                raise ValueError(f"Project with id {project_id} already exists.") from e
+            logger.error("Failed to add project: %s", e)
+            raise e
+        except Exception as e:
+            logger.error("Failed to add project: %s", e)
+            raise e
+
+    def add_projects(self, projects: List[Dict[str, Any]], user_id: str, organization_id: str) -> List[Dict[str, Any]]:
+        """
+        Add several projects to the database in one round-trip.
+        
+        Args:
+            projects: Dictionaries with an "id" and an optional "name"
+            user_id: The ID of the user
+            organization_id: The ID of the organization
             
-            logger.info(f"Adding project: {project_name} for user: {user_id} and organization: {organization_id}")
-            response = self.client.table(self.table_name).insert({
-                "id": project_id,
-                "name": project_name,
-                "user_id": user_id,
-                "organization_id": organization_id
-            }).execute()
+        Returns:
+            The inserted project rows
+        """
+        try:
+            if not projects or not user_id or not organization_id:
+                raise ValueError("Missing required fields")
+            if any(not project.get("id") for project in projects):
+                raise ValueError("Project ID is required")
+
+            logger.info("Adding %s projects for user: %s and organization: %s", len(projects), user_id, organization_id)
+            response = self.client.rpc("add_projects", {
+                "p_projects": [{"id": project["id"], "name": project.get("name")} for project in projects],
+                "p_user_id": user_id,
+                "p_organization_id": organization_id
+            }).select(self.SELECT_COLUMNS).execute()
 
+            with _PROJECT_CACHE_LOCK:
+                _PROJECT_LIST_CACHE.pop((user_id, organization_id), None)
+                for project in projects:
+                    _PROJECT_CACHE.pop((project["id"], user_id, organization_id), None)
             return response.data
+        except APIError as e:
+            if e.code == "23505":  # unique_violation on a project ID
+                raise ValueError("One or more projects already exist.") from e
+            logger.error("Failed to add projects: %s", e)
+            raise e
         except Exception as e:
-            logger.error(f"Failed to add project: {str(e)}")
+            logger.error("Failed to add projects: %s", e)
             raise e
         
     def fetch_all_projects_by_organization(self, user_id: str, organization_id: str) -> List[Dict[str, Any]]:
         """
         Fetch all projects from the database.
+
+        Results are cached in-process for 30 seconds per user and organization.
         """
-        logger.info(f"Fetching all projects for user: {user_id}")
+        logger.info("Fetching all projects for user: %s", user_id)
         if not user_id or not organization_id:
             logger.error("User ID and organization ID are required")
             raise ValueError("User ID and organization ID are required")
+        key = (user_id, organization_id)
+        with _PROJECT_CACHE_LOCK:
+            cached = _PROJECT_LIST_CACHE.get(key)
+        if cached is not None:
+            return list(cached)
         try:
             response = (
                 self.client.table(self.table_name)
-                .select("*")
+                .select(self.SELECT_COLUMNS)
                 .eq("user_id", user_id)
                 .eq("organization_id", organization_id)
                 .execute()
             )
-            return response.data
+            with _PROJECT_CACHE_LOCK:
+                _PROJECT_LIST_CACHE[key] = response.data
+            return list(response.data)
         except Exception as e:
-            logger.error(f"Failed to fetch projects: {str(e)}")
+            logger.error("Failed to fetch projects: %s", e)
             raise e
         
-    def fetch_project_by_id(self, project_id: str, user_id: str, organization_id: str) -> Dict[str, Any]:
+    def fetch_project_by_id(self, project_id: str, user_id: str, organization_id: str) -> Optional[Dict[str, Any]]:
         """
-        Fetch a project from the database by ID.
+        Fetch a project from the database by ID, or None if it does not exist.
+
+        Found projects are cached in-process for 30 seconds.
         """
-        logger.info(f"Fetching project by ID: {project_id}")
+        logger.info("Fetching project by ID: %s", project_id)
         if not project_id or not user_id or not organization_id:
             logger.error("Project ID, user ID, and organization ID are required")
             raise ValueError("Project ID, user ID, and organization ID are required")
+        key = (project_id, user_id, organization_id)
+        with _PROJECT_CACHE_LOCK:
+            cached = _PROJECT_CACHE.get(key)
+        if cached is not None:
+            return dict(cached)
         try:
             response = (
                 self.client.table(self.table_name)
-                .select("*")
+                .select(self.SELECT_COLUMNS)
                 .eq("id", project_id)
                 .eq("user_id", user_id)
                 .eq("organization_id", organization_id)
+                .maybe_single()
                 .execute()
             )
-            return response.data
+            # maybe_single() yields no response at all when the row is missing
+            if not response:
+                return None
+            with _PROJECT_CACHE_LOCK:
+                _PROJECT_CACHE[key] = response.data
+            return dict(response.data)
         except Exception as e:
-            logger.error(f"Failed to fetch project: {str(e)}")
+            logger.error("Failed to fetch project: %s", e)
             raise e
         
-    def _generate_random_name(self, user_id: str, organization_id: str) -> str:
+    def iter_projects_by_organization(self, user_id: str, organization_id: str, page_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
         """
-        Generate a random name for the project.
+        Yield a user's projects in an organization one page at a time.
+
+        Pages are fetched lazily with PostgREST range requests ordered by ID,
+        so at most page_size rows are held in memory. Not cached.
         """
+        logger.info("Streaming projects for user: %s", user_id)
         if not user_id or not organization_id:
             logger.error("User ID and organization ID are required")
             raise ValueError("User ID and organization ID are required")
-        all_projects = self.fetch_all_projects_by_organization(user_id, organization_id)
-        if not isinstance(all_projects, list):
-            raise ValueError("Invalid return type from fetch_all_projects")
-        
-        return f"Untitled Project {len(all_projects) + 1}"
\ No newline at end of file
+        offset = 0
+        while True:
+            try:
+                response = (
+                    self.client.table(self.table_name)
+                    .select(self.SELECT_COLUMNS)
+                    .eq("user_id", user_id)
+                    .eq("organization_id", organization_id)
+                    .order("id")
+                    .range(offset, offset + page_size - 1)
+                    .execute()
+                )
+            except Exception as e:
+                logger.error("Failed to fetch projects: %s", e)
+                raise e
+            if response.data:
+                yield response.data
+            if len(response.data) < page_size:
+                return
+            offset += page_size
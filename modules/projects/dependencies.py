@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 from modules.projects.clients import ProjectClient
 
+@lru_cache()
 def get_project_client() -> ProjectClient:
     return ProjectClient()
\ No newline at end of file
@@ -1,5 +1,8 @@
 # external imports
-from fastapi import APIRouter, HTTPException, Depends, Request
+import orjson
+from fastapi import APIRouter, Body, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Annotated, Iterator, List
 
 # internal imports
 from core.logger import setup_logger
@@ -9,21 +12,20 @@ from modules.projects.dependencies import get_project_client
 from modules.projects.clients import ProjectClient
 from modules.projects.schemas import (
     AddProjectRequest, 
-    FetchProjectByIdRequest
+    FetchProjectByIdRequest,
+    MAX_PROJECTS_PER_BATCH
 )
 
 logger = setup_logger(__name__)
 router = APIRouter(prefix="/v1/projects", tags=["projects"])
 
 @router.post("/add-project")
-async def add_project(
+def add_project(
     project_data: AddProjectRequest,
     user: AuthenticatedUser = Depends(get_authenticated_user),
     project_client: ProjectClient = Depends(get_project_client)
     ):
 
-    if not user.success:
-        raise HTTPException(status_code=401, detail="Unauthorized")
     if not project_data.project_id:
         raise HTTPException(status_code=400, detail="Project ID is required")
     try:
@@ -35,45 +37,92 @@ async def add_project(
         )
         return response[0]
     except ValueError as e:
-        logger.error(f"Failed to add project: {str(e)}")
+        logger.error("Failed to add project: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to add project: {str(e)}")
+        logger.error("Failed to add project: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/add-projects")
+def add_projects(
+    projects_data: Annotated[List[AddProjectRequest], Body(max_length=MAX_PROJECTS_PER_BATCH)],
+    user: AuthenticatedUser = Depends(get_authenticated_user),
+    project_client: ProjectClient = Depends(get_project_client)
+    ):
+    """Create up to MAX_PROJECTS_PER_BATCH (100) projects in one call; larger batches are rejected with 422."""
+    if not projects_data:
+        raise HTTPException(status_code=400, detail="At least one project is required")
+    if any(not project.project_id for project in projects_data):
+        raise HTTPException(status_code=400, detail="Project ID is required")
+    try:
+        return project_client.add_projects(
+            [{"id": project.project_id, "name": project.name} for project in projects_data],
+            user.user_id,
+            user.organization_id
+        )
+    except ValueError as e:
+        logger.error("Failed to add projects: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Failed to add projects: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/fetch-project-by-id")
-async def fetch_project_by_id(
+def fetch_project_by_id(
     project_data: FetchProjectByIdRequest,
     user: AuthenticatedUser = Depends(get_authenticated_user),
     project_client: ProjectClient = Depends(get_project_client)
     ):
-    if not user.success:
-        raise HTTPException(status_code=401, detail="Unauthorized")
     try:
         response = project_client.fetch_project_by_id(project_data.project_id, user.user_id, user.organization_id)
     except Exception as e:
-        logger.error(f"Failed to fetch project: {str(e)}")
+        logger.error("Failed to fetch project: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
     
-    if not response:
+    if response is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    return response[0]
+    return response
 
-@router.post("/fetch-all-projects-by-organization")
-async def fetch_all_projects_by_organization(
+@router.post("/fetch-all-projects-by-organization", response_class=ORJSONResponse, response_model=None)
+def fetch_all_projects_by_organization(
     user: AuthenticatedUser = Depends(get_authenticated_user),
     project_client: ProjectClient = Depends(get_project_client)
     ):
-    if not user.success:
-        raise HTTPException(status_code=401, detail="Unauthorized")
     try:
         response = project_client.fetch_all_projects_by_organization(
             user.user_id, 
             user.organization_id
         )
     except Exception as e:
-        logger.error(f"Failed to fetch all projects: {str(e)}")
+        logger.error("Failed to fetch all projects: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
     if not response:
         raise HTTPException(status_code=404, detail="No projects found")
-    return response
\ No newline at end of file
+    return ORJSONResponse(content=response)
+
+@router.post("/stream-projects-by-organization", response_class=StreamingResponse)
+def stream_projects_by_organization(
+    user: AuthenticatedUser = Depends(get_authenticated_user),
+    project_client: ProjectClient = Depends(get_project_client)
+    ):
+    """Stream all of the user's projects as newline-delimited JSON, one row per line."""
+    pages = project_client.iter_projects_by_organization(user.user_id, user.organization_id)
+    # Fetch the first page before the 200 goes out, so bad input and database
+    # errors still get a proper status code
+    try:
+        first_page = next(pages, [])
+    except ValueError as e:
+        logger.error("Failed to stream projects: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Failed to stream projects: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    def ndjson() -> Iterator[bytes]:
+        yield b"".join(orjson.dumps(row) + b"\n" for row in first_page)
+        # A later page failing aborts the response mid-body rather than
+        # completing it, so clients cannot mistake it for the full listing
+        for page in pages:
+            yield b"".join(orjson.dumps(row) + b"\n" for row in page)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
\ No newline at end of file
@@ -1,30 +1,15 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel
 from typing import Optional
-from uuid import UUID
+
+from shared.utils import UUIDStr
 
 class AddProjectRequest(BaseModel):
     name: Optional[str] = None
-    project_id: Optional[str] = None
-
-    @field_validator('project_id')
-    def validate_project_id(cls, v):
-        if v is not None:
-            try:
-                UUID(v)
-                return v
-            except ValueError:
-                raise ValueError(f"Invalid UUID format: {v}")
-        return v
+    project_id: Optional[UUIDStr] = None
     
 class FetchProjectByIdRequest(BaseModel):
-    project_id: str
+    project_id: UUIDStr
 
-    @field_validator('project_id')
-    def validate_project_id(cls, v):
-        if v is not None:
-            try:
-                UUID(v)
-                return v
-            except ValueError:
-                raise ValueError(f"Invalid UUID format: {v}")
-        return v
\ No newline at end of file
+# Largest batch accepted by /add-projects; the whole batch is inserted in one
+# transaction under the per-organization advisory lock
+MAX_PROJECTS_PER_BATCH = 100
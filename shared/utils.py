@@ -0,0 +1,25 @@
+# external imports
+import re
+from pydantic import AfterValidator
+from typing import Annotated
+from uuid import UUID
+
+# Canonical (hyphenated) UUID, as stored by Postgres
+_UUID_RE = re.compile(r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.I)
+
+def _validate_uuid(v: str) -> str:
+    """Check that an ID is a UUID string.
+
+    The canonical form is matched by regex without building a uuid.UUID;
+    anything else falls back to uuid.UUID, so every form it accepts
+    (unhyphenated, braced, urn:uuid:) stays valid.
+    """
+    if not _UUID_RE.match(v):
+        try:
+            UUID(v)
+        except ValueError:
+            raise ValueError(f"Invalid UUID format: {v}")
+    return v
+
+# String ID that must be a UUID, validated once by a shared validator
+UUIDStr = Annotated[str, AfterValidator(_validate_uuid)]
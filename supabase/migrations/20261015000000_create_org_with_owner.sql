@@ -0,0 +1,27 @@
+-- Creates an organization, links its owner and issues the owner's API key
+-- in a single transaction, so signup costs one round-trip and cannot leave
+-- an orphaned organization behind.
+create or replace function public.create_org_with_owner(
+    p_name text,
+    p_user_id uuid,
+    p_api_key text
+)
+returns public.organizations
+language plpgsql
+as $$
+declare
+    new_organization public.organizations;
+begin
+    insert into public.organizations (name)
+    values (p_name)
+    returning * into new_organization;
+
+    insert into public.user_organizations (user_id, organization_id)
+    values (p_user_id, new_organization.id);
+
+    insert into public.api_keys (user_id, organization_id, key)
+    values (p_user_id, new_organization.id, p_api_key);
+
+    return new_organization;
+end;
+$$;
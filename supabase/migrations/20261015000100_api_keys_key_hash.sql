@@ -0,0 +1,9 @@
+-- API key lookups go through a SHA-256 digest of the key instead of the raw
+-- key. The digest is a generated column, so existing rows are backfilled
+-- and every insert path (including create_org_with_owner) fills it in.
+alter table public.api_keys
+    add column if not exists key_hash text
+    generated always as (encode(extensions.digest(key, 'sha256'), 'hex')) stored;
+
+create unique index if not exists api_keys_key_hash_idx
+    on public.api_keys (key_hash);
@@ -0,0 +1,20 @@
+-- OAuth states are looked up (and consumed) by value, and only live for the
+-- few minutes between redirect and callback.
+alter table public.oauth_states
+    add column if not exists created_at timestamptz not null default now();
+
+create unique index if not exists oauth_states_state_idx
+    on public.oauth_states (state);
+
+-- Purge states from abandoned flows nightly, where pg_cron is available.
+do $$
+begin
+    if exists (select 1 from pg_extension where extname = 'pg_cron') then
+        perform cron.schedule(
+            'purge-oauth-states',
+            '0 3 * * *',
+            $cron$delete from public.oauth_states where created_at < now() - interval '1 hour'$cron$
+        );
+    end if;
+end
+$$;
@@ -0,0 +1,26 @@
+-- Creates an organization for its owner (see create_org_with_owner) and
+-- makes it the owner's default organization in the same transaction, so
+-- /add-organization is a single round-trip.
+create or replace function public.add_org_and_set_default(
+    p_name text,
+    p_user_id uuid,
+    p_api_key text,
+    p_profile_name text
+)
+returns public.organizations
+language plpgsql
+as $$
+declare
+    new_organization public.organizations;
+begin
+    new_organization := public.create_org_with_owner(p_name, p_user_id, p_api_key);
+
+    insert into public.user_profiles (id, name, default_organization)
+    values (p_user_id, p_profile_name, new_organization.id)
+    on conflict (id) do update
+        set name = excluded.name,
+            default_organization = excluded.default_organization;
+
+    return new_organization;
+end;
+$$;
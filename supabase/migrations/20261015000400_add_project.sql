@@ -0,0 +1,32 @@
+-- Inserts a project in one round-trip. When no name is given it is numbered
+-- "Untitled Project N" under a per-(user, organization) advisory lock, so
+-- concurrent creates cannot pick the same number.
+create or replace function public.add_project(
+    p_id uuid,
+    p_name text,
+    p_user_id uuid,
+    p_organization_id uuid
+)
+returns setof public.projects
+language plpgsql
+as $$
+declare
+    project_name text := p_name;
+begin
+    if project_name is null or project_name = '' then
+        perform pg_advisory_xact_lock(
+            hashtextextended(p_user_id::text || ':' || p_organization_id::text, 0)
+        );
+        select 'Untitled Project ' || (count(*) + 1)
+        into project_name
+        from public.projects
+        where user_id = p_user_id
+          and organization_id = p_organization_id;
+    end if;
+
+    return query
+    insert into public.projects (id, name, user_id, organization_id)
+    values (p_id, project_name, p_user_id, p_organization_id)
+    returning *;
+end;
+$$;
@@ -0,0 +1,4 @@
+-- Project listings and the add_project numbering count filter on
+-- (user_id, organization_id); index them so neither scans the whole table.
+create index if not exists projects_user_org_idx
+    on public.projects (user_id, organization_id);
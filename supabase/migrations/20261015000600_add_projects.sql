@@ -0,0 +1,49 @@
+-- Inserts a batch of projects in one round-trip. p_projects is a JSON array
+-- of {"id", "name"} objects; unnamed entries are numbered "Untitled Project N"
+-- in array order, continuing from the current count under the same advisory
+-- lock as add_project.
+create or replace function public.add_projects(
+    p_projects jsonb,
+    p_user_id uuid,
+    p_organization_id uuid
+)
+returns setof public.projects
+language plpgsql
+as $$
+declare
+    existing_count bigint := 0;
+begin
+    if exists (
+        select 1
+        from jsonb_array_elements(p_projects) as p(value)
+        where coalesce(p.value->>'name', '') = ''
+    ) then
+        perform pg_advisory_xact_lock(
+            hashtextextended(p_user_id::text || ':' || p_organization_id::text, 0)
+        );
+        select count(*)
+        into existing_count
+        from public.projects
+        where user_id = p_user_id
+          and organization_id = p_organization_id;
+    end if;
+
+    return query
+    insert into public.projects (id, name, user_id, organization_id)
+    select
+        (p.value->>'id')::uuid,
+        case
+            when coalesce(p.value->>'name', '') = '' then
+                'Untitled Project ' || (
+                    existing_count
+                    + count(*) filter (where coalesce(p.value->>'name', '') = '')
+                        over (order by p.ordinality)
+                )
+            else p.value->>'name'
+        end,
+        p_user_id,
+        p_organization_id
+    from jsonb_array_elements(p_projects) with ordinality as p(value, ordinality)
+    returning *;
+end;
+$$;
@@ -1,7 +1,9 @@
 # external imports
-from supabase import Client, create_client
+from supabase import Client, ClientOptions, create_client
+import base64
+import hmac
 import time
-import jwt
+import orjson
 from functools import lru_cache
 from fastapi import HTTPException
 
@@ -10,47 +12,68 @@ from core.config import settings
 from core.logger import setup_logger
 logger = setup_logger(__name__)
 
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWT segments require."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# Every user token carries the same HS256 header and signing key, so both
+# are encoded once
+_JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+_JWT_SECRET = settings.supabase_jwt_secret.encode()
+
 
 def generate_user_jwt(user_id: str) -> str:
     """
     Generate a JWT for a user.
+
+    The token is assembled by hand from the pre-encoded header, so only the
+    claims are serialized per call.
     """
     try:
-        payload = {
+        payload = _b64url(orjson.dumps({
             "sub": user_id,
             "role": "authenticated",
             "aud": "authenticated",
             "exp": int(time.time()) + 300
-        }
-        return jwt.encode(payload, settings.supabase_jwt_secret, algorithm="HS256")
-    except jwt.PyJWTError as e:
-        logger.error(f"JWT generation failed: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to generate authentication token"
-        )
+        }))
+        signing_input = _JWT_HEADER_B64 + b"." + payload
+        # One-shot hmac.digest runs entirely in OpenSSL, without an HMAC object
+        signature = hmac.digest(_JWT_SECRET, signing_input, "sha256")
+        return (signing_input + b"." + _b64url(signature)).decode()
     except Exception as e:
-        logger.error(f"Unexpected error in JWT generation: {str(e)}", exc_info=True)
+        logger.error("JWT generation failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
-            detail="Unexpected error during authentication"
+            detail="Failed to generate authentication token"
         )
     
 
 def get_anon_supabase_client() -> Client:
     """
-    Get the anonymous supabase client.
+    Get a new anonymous supabase client.
+
+    Session auto-refresh and persistence are off, so the client starts no
+    refresh timer thread and can be dropped as soon as the caller is done.
     """
-    return create_client(settings.supabase_url, settings.supabase_key)
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_key,
+        options=ClientOptions(auto_refresh_token=False, persist_session=False)
+    )
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """
-    Get the supabase client from the API key.
+    Get the process-wide supabase client.
+
+    The client is created once and shared by every module so its HTTP
+    connection pool is reused across requests.
     """
     
     client = create_client(
         settings.supabase_url,
-        settings.supabase_key
+        settings.supabase_key,
+        options=ClientOptions(postgrest_client_timeout=10, storage_client_timeout=10)
     )
     return client
 
@@ -111,10 +134,3 @@ def get_supabase_client() -> Client:
 #             status_code=500, 
 #             detail="Internal server error during authentication"
 #         )
-
-def get_user_id_from_api_key(api_key: str) -> str:
-    """
-    Get the user ID from the API key.
-    """
-    client = get_supabase_client(api_key)
-    return client.auth.admin.get_user_by_id(api_key).user.id